@@ -22,12 +22,17 @@ along with this program. If not, see <https://www.gnu.org/licenses/>.
 import sys
 import os
 import re
+import mmap
 import json
 import shutil
+import bisect
+import functools
 import traceback
 import logging
+from itertools import chain
 from pathlib import Path
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Dict, List, Tuple, Optional
 
 # Get user data directory (writable location)
@@ -77,12 +82,12 @@ from PyQt5.QtCore import (
     Qt, QRectF, QPointF, pyqtSignal, QTimer
 )
 from PyQt5.QtGui import (
-    QPen, QBrush, QColor, QPixmap, QPainter, QTransform,
+    QPen, QBrush, QColor, QImage, QPixmap, QPainter, QTransform,
     QKeySequence, QFont, QCursor
 )
 
-from lxml import etree
-from PIL import Image
+# lxml and Pillow are imported where they are used; neither is needed
+# until files are loaded, so they stay off the startup path
 
 # Constants
 DEFAULT_WORLD_SIZE = 16384
@@ -103,9 +108,51 @@ COLOR_DEFAULT = QColor(255, 255, 0, 100)  # Yellow
 COLOR_SELECTED = QColor(0, 120, 255, 150)  # Blue
 COLOR_HOVER = QColor(255, 165, 0, 120)  # Orange
 
+# Zone border pens, shared by all zone items instead of built per item/selection
+PEN_DYNAMIC = QPen(COLOR_DEFAULT, 2)  # Yellow dynamic zone border
+PEN_STATIC = QPen(QColor(255, 255, 255), 2)  # White static zone border
+PEN_SELECTED = QPen(COLOR_SELECTED, 3)  # Blue selected zone border
+
+# Danger fill colors, one per health quintile (weakest to strongest)
+DANGER_COLORS = (
+    (0, 255, 0),  # Very Low - Green
+    (128, 255, 0),  # Low - Yellow-Green
+    (255, 255, 0),  # Medium - Yellow
+    (255, 165, 0),  # High - Orange
+    (255, 0, 0),  # Very High - Red
+)
+
+# Parser patterns (compiled once at import)
+DYNAMIC_ZONE_RE = re.compile(
+    r'ref\s+autoptr\s+TIntArray\s+data_(Zone\d+)\s*=\s*\{(\d+),\s*(\d+),\s*(\d+),\s*(\d+),\s*(\d+),\s*\d+,\s*\d+\};\s*//\s*(.*)$'
+)
+STATIC_ZONE_RE = re.compile(
+    r'ref\s+autoptr\s+TFloatArray\s+data_(HordeStatic\d+)\s*=\s*\{([^}]+)\};\s*//\s*(.*)$'
+)
+STATIC_ZONE_SAVE_RE = re.compile(
+    r'(ref\s+autoptr\s+TFloatArray\s+data_(HordeStatic\d+)\s*=\s*\{)([^}]+)(\};\s*)//\s*(.*)$'
+)
+# bytes pattern, run over an mmap; spans stop at ';' so a malformed entry can't run into the next one
+CATEGORIES_MAPPING_RE = re.compile(
+    rb'data_Horde_(\d+)_\w+Categories\s*=\s*new\s+Param5[^(;]+\([^,;]+,[^,;]+,\s*(\w+),\s*(\w+),\s*(\w+)\)'
+)
+CATEGORY_DEFINITION_RE = re.compile(
+    r'ref\s+autoptr\s+TStringArray\s+(\w+)\s*=\s*\{([^}]*)\};',
+    re.MULTILINE | re.DOTALL
+)
+QUOTED_STRING_RE = re.compile(r'"([^"]+)"')
+
 
 class ZoneData:
     """Data class for zone information"""
+    
+    # Fixed attribute layout: no per-instance __dict__ for the hundreds of zones loaded
+    __slots__ = (
+        'zone_id', 'zone_type', 'num_config', 'comment', 'categories', 'danger_level',
+        'coordx_upleft', 'coordz_upleft', 'coordx_lowerright', 'coordz_lowerright',
+        'coordx', 'coordz', 'coordy'
+    )
+    
     def __init__(self, zone_type='dynamic'):
         self.zone_id = ''
         self.zone_type = zone_type  # 'dynamic' or 'static'
@@ -186,6 +233,29 @@ class ZoneData:
         return zone
 
 
+def cache_by_file_stat(parser):
+    """Memoize a file parser on (path, mtime, size)
+    
+    Reloading unchanged files returns the previous result instead of parsing
+    again. Only for parsers whose results are never mutated by the caller.
+    """
+    cache = {}  # filepath -> (mtime_ns, size, result)
+    
+    @functools.wraps(parser)
+    def wrapper(filepath: str):
+        stat = os.stat(filepath)
+        cached = cache.get(filepath)
+        if cached and cached[0] == stat.st_mtime_ns and cached[1] == stat.st_size:
+            logger.debug(f"{parser.__name__}: {filepath} unchanged, using cached result")
+            return cached[2]
+        
+        result = parser(filepath)
+        cache[filepath] = (stat.st_mtime_ns, stat.st_size, result)
+        return result
+    
+    return wrapper
+
+
 class FileParser:
     """Parse PvZmoD configuration files"""
     
@@ -193,23 +263,20 @@ class FileParser:
     def parse_dynamic_zones(filepath: str) -> List[ZoneData]:
         """Parse DynamicSpawnZones.c"""
         zones = []
-        pattern = r'ref\s+autoptr\s+TIntArray\s+data_(Zone\d+)\s*=\s*\{(\d+),\s*(\d+),\s*(\d+),\s*(\d+),\s*(\d+),\s*\d+,\s*\d+\};\s*//\s*(.*)$'
         
         with open(filepath, 'r', encoding='utf-8') as f:
             for line in f:
                 # Skip commented lines
-                if line.strip().startswith('///') or line.strip().startswith('//'):
+                stripped = line.strip()
+                if stripped.startswith('//'):
                     continue
-                    
-                match = re.search(pattern, line)
+                
+                match = DYNAMIC_ZONE_RE.search(line)
                 if match:
                     zone = ZoneData('dynamic')
                     zone.zone_id = match.group(1)
-                    zone.num_config = int(match.group(2))
-                    zone.coordx_upleft = int(match.group(3))
-                    zone.coordz_upleft = int(match.group(4))
-                    zone.coordx_lowerright = int(match.group(5))
-                    zone.coordz_lowerright = int(match.group(6))
+                    (zone.num_config, zone.coordx_upleft, zone.coordz_upleft,
+                     zone.coordx_lowerright, zone.coordz_lowerright) = map(int, match.group(2, 3, 4, 5, 6))
                     zone.comment = match.group(7).strip()
                     zones.append(zone)
         
@@ -219,94 +286,116 @@ class FileParser:
     def parse_static_zones(filepath: str) -> List[ZoneData]:
         """Parse StaticSpawnDatas.c"""
         zones = []
-        pattern = r'ref\s+autoptr\s+TFloatArray\s+data_(HordeStatic\d+)\s*=\s*\{[^}]+\};\s*//\s*(.*)$'
         
         with open(filepath, 'r', encoding='utf-8') as f:
             for line in f:
                 # Skip commented lines
-                if line.strip().startswith('///') or line.strip().startswith('//'):
+                stripped = line.strip()
+                if stripped.startswith('//'):
                     continue
-                    
-                match = re.search(pattern, line)
+                
+                match = STATIC_ZONE_RE.search(line)
                 if match:
-                    zone_id = match.group(1)
-                    comment = match.group(2).strip()
-                    
-                    # Extract parameters
-                    params_match = re.search(r'\{([^}]+)\}', line)
-                    if params_match:
-                        params = [p.strip() for p in params_match.group(1).split(',')]
-                        if len(params) >= 12:
-                            zone = ZoneData('static')
-                            zone.zone_id = zone_id
-                            zone.coordx = int(float(params[4]))
-                            zone.coordy = int(float(params[5]))
-                            zone.coordz = int(float(params[6]))
-                            zone.num_config = int(float(params[11]))
-                            zone.comment = comment
-                            zones.append(zone)
+                    # Parameters are captured in the same pass; split by position
+                    params = match.group(2).split(',')
+                    if len(params) >= 12:
+                        zone = ZoneData('static')
+                        zone.zone_id = match.group(1)
+                        zone.coordx, zone.coordy, zone.coordz, zone.num_config = map(
+                            int, map(float, (params[4], params[5], params[6], params[11]))
+                        )
+                        zone.comment = match.group(3).strip()
+                        zones.append(zone)
         
         return zones
     
     @staticmethod
+    @cache_by_file_stat
     def parse_categories_mapping(filepath: str) -> Dict[int, Dict[str, List[str]]]:
         """Parse ZombiesChooseCategories.c"""
         config_mapping = {}
-        pattern = r'data_Horde_(\d+)_\w+Categories\s*=\s*new\s+Param5[^(]+\([^,]+,[^,]+,\s*(\w+),\s*(\w+),\s*(\w+)\)'
         
-        with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-            
-        for match in re.finditer(pattern, content):
-            config_num = int(match.group(1))
-            cat1 = match.group(2).strip()
-            cat2 = match.group(3).strip()
-            cat3 = match.group(4).strip()
-            
-            config_mapping[config_num] = {
-                'category1': cat1 if cat1 != 'Empty' else None,
-                'category2': cat2 if cat2 != 'Empty' else None,
-                'category3': cat3 if cat3 != 'Empty' else None
-            }
+        with open(filepath, 'rb') as f:
+            # mmap cannot map an empty file
+            if os.fstat(f.fileno()).st_size == 0:
+                return config_mapping
+            
+            # Scan the mapped file directly; only captured names are decoded
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as content:
+                for match in CATEGORIES_MAPPING_RE.finditer(content):
+                    config_num = int(match.group(1))
+                    cat1 = match.group(2).decode('utf-8')
+                    cat2 = match.group(3).decode('utf-8')
+                    cat3 = match.group(4).decode('utf-8')
+                    
+                    config_mapping[config_num] = {
+                        'category1': cat1 if cat1 != 'Empty' else None,
+                        'category2': cat2 if cat2 != 'Empty' else None,
+                        'category3': cat3 if cat3 != 'Empty' else None
+                    }
         
         return config_mapping
     
     @staticmethod
+    @cache_by_file_stat
     def parse_categories_definitions(filepath: str) -> Dict[str, List[str]]:
         """Parse ZombiesCategories.c"""
         categories = {}
-        pattern = r'ref\s+autoptr\s+TStringArray\s+(\w+)\s*=\s*\{([^}]*)\};'
+        buffer = []  # Lines of the entry currently being read
         
+        # Stream the file one entry at a time instead of reading it whole
         with open(filepath, 'r', encoding='utf-8') as f:
-            content = f.read()
-        
-        for match in re.finditer(pattern, content, re.MULTILINE | re.DOTALL):
-            category_name = match.group(1)
-            classnames_block = match.group(2)
-            
-            # Extract quoted strings
-            classnames = re.findall(r'"([^"]+)"', classnames_block)
-            categories[category_name] = classnames
+            for line in f:
+                if not buffer and 'TStringArray' not in line:
+                    continue
+                
+                buffer.append(line)
+                if '}' not in line:
+                    continue
+                
+                chunk = ''.join(buffer)
+                for match in CATEGORY_DEFINITION_RE.finditer(chunk):
+                    category_name = match.group(1)
+                    classnames_block = match.group(2)
+                    
+                    # Extract quoted strings (no quote means an empty array; skip the regex)
+                    if '"' not in classnames_block:
+                        categories[category_name] = []
+                        continue
+                    categories[category_name] = QUOTED_STRING_RE.findall(classnames_block)
+                
+                # Keep an entry that opens after the closing brace on this line
+                tail = chunk[chunk.rfind('}') + 1:]
+                buffer = [tail] if 'TStringArray' in tail else []
         
         return categories
     
     @staticmethod
+    @cache_by_file_stat
     def parse_zombie_health(filepath: str) -> Dict[str, float]:
         """Parse PvZmoD_CustomisableZombies_Characteristics.xml"""
+        from lxml import etree
+        
         health_map = {}
         
         try:
-            tree = etree.parse(filepath)
-            root = tree.getroot()
-            
-            for zombie_type in root.findall('.//type'):
+            # Stream <type> elements instead of building the whole tree;
+            # each one is cleared and detached once its health has been read
+            for _, zombie_type in etree.iterparse(filepath, events=('end',), tag='type'):
                 name = zombie_type.get('name')
                 health_elem = zombie_type.find('Health_Points')
                 if name and health_elem is not None:
                     day_health = float(health_elem.get('Day', 100))
                     health_map[name] = day_health
+                zombie_type.clear()
+                # A cleared element stays attached to its parent; drop the
+                # siblings already handled so the tree doesn't keep growing
+                while zombie_type.getprevious() is not None:
+                    del zombie_type.getparent()[0]
         except Exception as e:
             print(f"Warning: Could not parse zombie health: {e}")
+            # iterparse yields elements up to the error; don't keep a partial map
+            health_map = {}
         
         return health_map
     
@@ -326,13 +415,14 @@ class FileParser:
         
         for zone in sorted(zones, key=lambda z: z.zone_id):
             if zone.zone_type == 'dynamic':
-                line = f"ref autoptr  TIntArray data_{zone.zone_id} = "
-                line += f"{{{zone.num_config},\t\t\t{zone.coordx_upleft},\t\t\t{zone.coordz_upleft},\t\t\t"
-                line += f"{zone.coordx_lowerright},\t\t\t\t{zone.coordz_lowerright},\t\t\t\t100,\t\t\t25}}; \t\t// {zone.comment}\n"
-                lines.append(line)
+                # Adjacent f-strings compile into a single string build per line
+                lines.append(
+                    f"ref autoptr  TIntArray data_{zone.zone_id} = "
+                    f"{{{zone.num_config},\t\t\t{zone.coordx_upleft},\t\t\t{zone.coordz_upleft},\t\t\t"
+                    f"{zone.coordx_lowerright},\t\t\t\t{zone.coordz_lowerright},\t\t\t\t100,\t\t\t25}}; \t\t// {zone.comment}\n"
+                )
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.writelines(lines)
+        Path(filepath).write_text(''.join(lines), encoding='utf-8')
     
     @staticmethod
     def save_static_zones(zones: List[ZoneData], filepath: str):
@@ -342,18 +432,17 @@ class FileParser:
         shutil.copy2(filepath, backup_path)
         
         # Read original file to preserve all parameters
-        with open(filepath, 'r', encoding='utf-8') as f:
-            original_lines = f.readlines()
+        original_lines = Path(filepath).read_text(encoding='utf-8').split('\n')
         
         # Build map of zone_id to zone data
         zone_map = {z.zone_id: z for z in zones if z.zone_type == 'static'}
         
         # Process lines
         new_lines = []
-        pattern = r'(ref\s+autoptr\s+TFloatArray\s+data_(HordeStatic\d+)\s*=\s*\{)([^}]+)(\};\s*)//\s*(.*)$'
         
         for line in original_lines:
-            match = re.search(pattern, line)
+            # Substring test first - only entry lines are worth a regex search
+            match = STATIC_ZONE_SAVE_RE.search(line) if 'HordeStatic' in line else None
             if match and match.group(2) in zone_map:
                 # Update this line
                 zone = zone_map[match.group(2)]
@@ -366,15 +455,14 @@ class FileParser:
                 if len(params) >= 12:
                     params[11] = str(zone.num_config)
                     new_params_str = ', '.join(params)
-                    new_line = f"{prefix}{new_params_str}{suffix}// {zone.comment}\n"
+                    new_line = f"{prefix}{new_params_str}{suffix}// {zone.comment}"
                     new_lines.append(new_line)
                 else:
                     new_lines.append(line)  # Keep original if parsing fails
             else:
                 new_lines.append(line)  # Keep original line
         
-        with open(filepath, 'w', encoding='utf-8') as f:
-            f.writelines(new_lines)
+        Path(filepath).write_text('\n'.join(new_lines), encoding='utf-8')
 
 
 class MapCanvas(QGraphicsView):
@@ -390,6 +478,7 @@ class MapCanvas(QGraphicsView):
         
         self.world_size = DEFAULT_WORLD_SIZE
         self.image_size = DEFAULT_IMAGE_SIZE
+        self._update_scale()
         
         self.zones = {}  # zone_id -> ZoneData
         self.zone_graphics = {}  # zone_id -> QGraphicsRectItem/EllipseItem
@@ -405,11 +494,16 @@ class MapCanvas(QGraphicsView):
         
         # Zone editing
         self.editing_mode = False
-        self.resize_handles = []
+        self.resize_handles = {}  # handle item -> corner ('nw', 'ne', 'sw', 'se')
         self.resize_handle_size = 8
         self.active_handle = None
         self.drag_start_pos = None
         self.drag_start_rect = None
+        self.drag_item = None  # Zone item being resized/moved
+        self.drag_label = None  # Label following the dragged zone
+        self.drag_start_edges = None  # (left, top, right, bottom) of drag_start_rect
+        self.drag_limits = None  # Corner clamp limits for the current drag
+        self.drag_last_rect = None  # Last rect applied during the current drag
         
         # Panning with middle mouse button
         self.panning = False
@@ -430,15 +524,20 @@ class MapCanvas(QGraphicsView):
         
         # Danger color coding
         self.zombie_health = {}  # Will be set by main window
+        self.category_health = {}  # category name -> (total health, zombie count)
         self._reset_health_thresholds()  # Initialize default thresholds
         
         # Background
         self.background_pixmap = None
         self.background_item = None
         
-    def load_map_image(self, filepath: str):
-        """Load background map image"""
-        pixmap = QPixmap(filepath)
+    def load_map_image(self, filepath: str, image: Optional[QImage] = None):
+        """Load background map image
+        
+        image may be the file already decoded off the GUI thread; only the
+        QPixmap conversion has to happen here.
+        """
+        pixmap = QPixmap.fromImage(image) if image is not None else QPixmap(filepath)
         if pixmap.isNull():
             QMessageBox.warning(self, "Error", f"Could not load image: {filepath}")
             return
@@ -452,6 +551,7 @@ class MapCanvas(QGraphicsView):
         
         # Update image size for coordinate conversion
         self.image_size = pixmap.width()
+        self._update_scale()
         logger.info(f"Map image loaded: {pixmap.width()}x{pixmap.height()}")
     
     def set_map_config(self, world_size: int, image_size: int = None):
@@ -459,11 +559,18 @@ class MapCanvas(QGraphicsView):
         self.world_size = world_size
         if image_size:
             self.image_size = image_size
+        self._update_scale()
         logger.info(f"Map config set: world_size={world_size}, image_size={self.image_size}")
     
+    def _update_scale(self):
+        """Cache world/pixel scale factors for the current map config"""
+        self.world_to_pixel_scale = self.image_size / self.world_size
+        self.pixel_to_world_scale = self.world_size / self.image_size
+    
     def set_zombie_health(self, zombie_health: dict):
         """Set zombie health data for danger color coding"""
         self.zombie_health = zombie_health
+        self.category_health = {}
         
         # Calculate health range for relative danger levels
         if zombie_health:
@@ -491,6 +598,8 @@ class MapCanvas(QGraphicsView):
         else:
             self._reset_health_thresholds()
         
+        self.danger_thresholds = (self.health_20th, self.health_40th, self.health_60th, self.health_80th)
+        
         # Update colors for existing zones
         for zone_id, zone in self.zones.items():
             self._update_zone_color(zone_id)
@@ -503,26 +612,35 @@ class MapCanvas(QGraphicsView):
         self.health_40th = 100
         self.health_60th = 120
         self.health_80th = 150
+        self.danger_thresholds = (self.health_20th, self.health_40th, self.health_60th, self.health_80th)
     
     def _calculate_danger_level(self, zone: ZoneData) -> float:
         """Calculate average health of zombies in zone (danger level)"""
-        if not self.zombie_health or not hasattr(zone, 'categories') or not zone.categories:
+        if not self.zombie_health or not zone.categories:
             return 0.0
         
         total_health = 0.0
         zombie_count = 0
         
+        # Zones share a handful of categories, so sum each category's zombies once
         for cat_name, zombie_list in zone.categories.items():
-            for zombie_name in zombie_list:
-                if zombie_name in self.zombie_health:
-                    total_health += self.zombie_health[zombie_name]
-                    zombie_count += 1
+            totals = self.category_health.get(cat_name)
+            if totals is None:
+                healths = [self.zombie_health[z] for z in zombie_list if z in self.zombie_health]
+                totals = self.category_health[cat_name] = (sum(healths), len(healths))
+            total_health += totals[0]
+            zombie_count += totals[1]
         
         if zombie_count == 0:
             return 0.0
         
         return total_health / zombie_count
     
+    def _zone_danger_color(self, zone: ZoneData) -> QColor:
+        """Compute a zone's danger level, store it on the zone and return its color"""
+        zone.danger_level = self._calculate_danger_level(zone)
+        return self._get_danger_color(zone.danger_level)
+    
     def _get_danger_color(self, avg_health: float) -> QColor:
         """Get color based on average zombie health (relative to loaded zombie set)
         
@@ -533,24 +651,13 @@ class MapCanvas(QGraphicsView):
         - 60-80%: High (orange)
         - Top 20%: Very High (red)
         """
-        if avg_health <= 0 or not hasattr(self, 'health_20th'):
+        if avg_health <= 0:
             # No health data - use default yellow
             return QColor(255, 255, 0, 30)
-        elif avg_health <= self.health_20th:
-            # Very Low - Green (bottom 20%)
-            return QColor(0, 255, 0, 30)
-        elif avg_health <= self.health_40th:
-            # Low - Yellow-Green (20-40%)
-            return QColor(128, 255, 0, 30)
-        elif avg_health <= self.health_60th:
-            # Medium - Yellow (40-60%)
-            return QColor(255, 255, 0, 30)
-        elif avg_health <= self.health_80th:
-            # High - Orange (60-80%)
-            return QColor(255, 165, 0, 30)
-        else:
-            # Very High - Red (top 20%)
-            return QColor(255, 0, 0, 30)
+        
+        # First threshold >= avg_health picks the quintile; past the last is red
+        r, g, b = DANGER_COLORS[bisect.bisect_left(self.danger_thresholds, avg_health)]
+        return QColor(r, g, b, 30)
     
     def _update_zone_color(self, zone_id: str):
         """Update zone color based on danger level"""
@@ -560,8 +667,7 @@ class MapCanvas(QGraphicsView):
         zone = self.zones[zone_id]
         graphic = self.zone_graphics[zone_id]
         
-        danger_level = self._calculate_danger_level(zone)
-        color = self._get_danger_color(danger_level)
+        color = self._zone_danger_color(zone)
         
         if zone.zone_type == 'dynamic':
             # Dynamic zones: semi-transparent fill
@@ -574,9 +680,20 @@ class MapCanvas(QGraphicsView):
     
     def set_zones(self, zones: List[ZoneData]):
         """Set all zones"""
-        self.clear_zones()
-        for zone in zones:
-            self.add_zone(zone)
+        # New zones may come with new category definitions
+        self.category_health = {}
+        
+        # Bulk rebuild: skip per-item BSP index updates and repaints, then
+        # build the index once when everything is in place
+        self.setUpdatesEnabled(False)
+        self.scene.setItemIndexMethod(QGraphicsScene.NoIndex)
+        try:
+            self.clear_zones()
+            for zone in zones:
+                self.add_zone(zone)
+        finally:
+            self.scene.setItemIndexMethod(QGraphicsScene.BspTreeIndex)
+            self.setUpdatesEnabled(True)
     
     def add_zone(self, zone: ZoneData):
         """Add a zone to the canvas"""
@@ -597,17 +714,13 @@ class MapCanvas(QGraphicsView):
             abs(x2 - x1), abs(z2 - z1)
         )
         
-        rect_item = self.scene.addRect(rect)
-        rect_item.setPen(QPen(COLOR_DEFAULT, 2))
-        
-        # Calculate danger color based on zombie health
-        danger_level = self._calculate_danger_level(zone)
-        color = self._get_danger_color(danger_level)
-        rect_item.setBrush(QBrush(color))
+        # Danger color based on zombie health
+        color = self._zone_danger_color(zone)
         
+        # Pen and brush are applied as the item is created
+        rect_item = self.scene.addRect(rect, PEN_DYNAMIC, QBrush(color))
         rect_item.setFlag(QGraphicsRectItem.ItemIsSelectable, False)
         rect_item.setData(0, zone.zone_id)  # Store zone_id
-        rect_item.setAcceptHoverEvents(True)
         
         # Set z-value based on area - smaller zones on top
         area = rect.width() * rect.height()
@@ -628,25 +741,21 @@ class MapCanvas(QGraphicsView):
         """Add static zone point"""
         x, z = self.world_to_pixel(zone.coordx, zone.coordz)
         
-        # Calculate danger color based on zombie health
-        danger_level = self._calculate_danger_level(zone)
-        color = self._get_danger_color(danger_level)
+        # Danger color based on zombie health
+        color = self._zone_danger_color(zone)
         
         # Make color more opaque for static zones (they're small circles)
         if color.alpha() == 30:
             color.setAlpha(150)  # More visible
         
         radius = 6  # Slightly larger for better visibility
+        # White border for visibility over dynamic zones
         ellipse_item = self.scene.addEllipse(
-            x - radius, z - radius, radius * 2, radius * 2
+            x - radius, z - radius, radius * 2, radius * 2,
+            PEN_STATIC, QBrush(color)
         )
-        
-        # White border for visibility over dynamic zones
-        ellipse_item.setPen(QPen(QColor(255, 255, 255), 2))
-        ellipse_item.setBrush(QBrush(color))
         ellipse_item.setFlag(QGraphicsEllipseItem.ItemIsSelectable, False)
         ellipse_item.setData(0, zone.zone_id)
-        ellipse_item.setAcceptHoverEvents(True)
         
         # High z-value so static zones always visible above dynamic zones
         ellipse_item.setZValue(2000000)  # Higher than any dynamic zone
@@ -697,10 +806,10 @@ class MapCanvas(QGraphicsView):
             item = self.zone_graphics[self.selected_zone_id]
             if isinstance(item, QGraphicsRectItem):
                 # Dynamic zone - restore default yellow border
-                item.setPen(QPen(COLOR_DEFAULT, 2))
+                item.setPen(PEN_DYNAMIC)
             else:
                 # Static zone - restore white border
-                item.setPen(QPen(QColor(255, 255, 255), 2))
+                item.setPen(PEN_STATIC)
         
         # Remove old resize handles
         self._clear_resize_handles()
@@ -709,7 +818,7 @@ class MapCanvas(QGraphicsView):
         self.selected_zone_id = zone_id
         if zone_id and zone_id in self.zone_graphics:
             item = self.zone_graphics[zone_id]
-            item.setPen(QPen(COLOR_SELECTED, 3))
+            item.setPen(PEN_SELECTED)
             
             # Only add resize handles if in edit mode
             zone = self.zones.get(zone_id)
@@ -755,19 +864,21 @@ class MapCanvas(QGraphicsView):
             ('se', rect.bottomRight()),
         ]
         
+        # All four handles share one brush and pen
+        brush = QBrush(QColor(0, 120, 255))
+        pen = QPen(QColor(255, 255, 255), 1)
+        
         for handle_type, pos in positions:
             handle = self.scene.addRect(
                 pos.x() - handle_size/2,
                 pos.y() - handle_size/2,
                 handle_size,
-                handle_size
+                handle_size,
+                pen,
+                brush
             )
-            handle.setBrush(QBrush(QColor(0, 120, 255)))
-            handle.setPen(QPen(QColor(255, 255, 255), 1))
             handle.setZValue(999999)  # Always on top
-            handle.setData(0, f"handle_{handle_type}")
-            handle.setData(1, 'temp' if rect_item == self.temp_new_zone else self.selected_zone_id)
-            self.resize_handles.append(handle)
+            self.resize_handles[handle] = handle_type
     
     def finish_drawing(self):
         """Clean up after finishing zone drawing"""
@@ -785,16 +896,39 @@ class MapCanvas(QGraphicsView):
     
     def world_to_pixel(self, world_x: int, world_z: int) -> Tuple[float, float]:
         """Convert world coordinates to pixel coordinates"""
-        pixel_x = world_x * (self.image_size / self.world_size)
-        pixel_y = self.image_size - (world_z * (self.image_size / self.world_size))
+        pixel_x = world_x * self.world_to_pixel_scale
+        pixel_y = self.image_size - (world_z * self.world_to_pixel_scale)
         return pixel_x, pixel_y
     
     def pixel_to_world(self, pixel_x: float, pixel_y: float) -> Tuple[int, int]:
         """Convert pixel coordinates to world coordinates"""
-        world_x = int(pixel_x * (self.world_size / self.image_size))
-        world_z = int((self.image_size - pixel_y) * (self.world_size / self.image_size))
+        world_x = int(pixel_x * self.pixel_to_world_scale)
+        world_z = int((self.image_size - pixel_y) * self.pixel_to_world_scale)
         return world_x, world_z
     
+    def _start_drag(self, handle: str, pos: QPointF, start_rect: Optional[QRectF], zone_item):
+        """Record the state for a resize/move drag starting at pos"""
+        self.active_handle = handle
+        self.drag_start_pos = pos
+        self.drag_start_rect = start_rect
+        self.drag_item = zone_item
+        self.drag_label = self.zone_labels.get(self.selected_zone_id) if zone_item else None
+        self.drag_last_rect = None
+        self.setDragMode(QGraphicsView.NoDrag)
+        
+        # Start edges and corner clamp limits are fixed for the whole drag
+        if start_rect is not None:
+            left, top = start_rect.left(), start_rect.top()
+            right, bottom = start_rect.right(), start_rect.bottom()
+            min_size = MIN_ZONE_SIZE * self.world_to_pixel_scale  # Minimum zone size in pixels
+            self.drag_start_edges = (left, top, right, bottom)
+            self.drag_limits = (
+                right - min_size,   # max left
+                bottom - min_size,  # max top
+                left + min_size,    # min right
+                top + min_size,     # min bottom
+            )
+    
     def mousePressEvent(self, event):
         """Handle mouse press"""
         pos = self.mapToScene(event.pos())
@@ -817,14 +951,10 @@ class MapCanvas(QGraphicsView):
         # Check for resize handle (works for both temp and existing zones)
         items = self.scene.items(pos)
         for item in items:
-            handle_type = item.data(0)
-            if handle_type and isinstance(handle_type, str) and handle_type.startswith('handle_'):
-                self.active_handle = handle_type.replace('handle_', '')
-                self.drag_start_pos = pos
+            handle_type = self.resize_handles.get(item)
+            if handle_type:
                 zone_item = self.temp_new_zone if self.temp_new_zone else self.zone_graphics.get(self.selected_zone_id)
-                if zone_item:
-                    self.drag_start_rect = zone_item.rect()
-                self.setDragMode(QGraphicsView.NoDrag)
+                self._start_drag(handle_type, pos, zone_item.rect() if zone_item else None, zone_item)
                 return
         
         # Check for zone body dragging (only in edit mode for existing zones)
@@ -835,15 +965,12 @@ class MapCanvas(QGraphicsView):
                     zone = self.zones[zone_id]
                     if zone.zone_type == 'dynamic' and event.button() == Qt.LeftButton:
                         # Start drag mode
-                        self.active_handle = 'move'
-                        self.drag_start_pos = pos
-                        self.drag_start_rect = self.zone_graphics[zone_id].rect()
-                        self.setDragMode(QGraphicsView.NoDrag)
+                        self._start_drag('move', pos, self.zone_graphics[zone_id].rect(),
+                                         self.zone_graphics.get(self.selected_zone_id))
                         return
         
         # Check for zone selection (always allow selection, except when drawing temp zone)
         if not self.temp_new_zone:
-            items = self.scene.items(pos)
             for item in items:
                 zone_id = item.data(0)
                 if zone_id and zone_id in self.zones:
@@ -854,7 +981,8 @@ class MapCanvas(QGraphicsView):
     
     def mouseMoveEvent(self, event):
         """Handle mouse move"""
-        pos = self.mapToScene(event.pos())
+        # Most moves are plain hovering that falls through to the base class;
+        # only drawing and dragging map the cursor into the scene
         
         # Handle panning with middle mouse button
         if self.panning:
@@ -865,50 +993,51 @@ class MapCanvas(QGraphicsView):
             return
         
         if self.drawing_mode and self.draw_rect:
-            rect = QRectF(
-                min(self.draw_start.x(), pos.x()),
-                min(self.draw_start.y(), pos.y()),
-                abs(pos.x() - self.draw_start.x()),
-                abs(pos.y() - self.draw_start.y())
-            )
-            self.draw_rect.setRect(rect)
+            # Span start and cursor; normalized() flips negative width/height
+            pos = self.mapToScene(event.pos())
+            self.draw_rect.setRect(QRectF(self.draw_start, pos).normalized())
             return
         
         # Handle resizing (for both temp new zone and existing zones)
         if self.active_handle and self.drag_start_rect:
-            zone_item = self.temp_new_zone if self.temp_new_zone else self.zone_graphics.get(self.selected_zone_id)
+            # Item was resolved once when the drag started
+            zone_item = self.drag_item
             if not zone_item:
                 return
             
+            pos = self.mapToScene(event.pos())
             delta_x = pos.x() - self.drag_start_pos.x()
             delta_y = pos.y() - self.drag_start_pos.y()
             
-            old_rect = self.drag_start_rect
-            new_rect = QRectF(old_rect)
+            left, top, right, bottom = self.drag_start_edges
+            max_left, max_top, min_right, min_bottom = self.drag_limits
             
             if self.active_handle == 'move':
                 # Move entire zone
-                new_rect.translate(delta_x, delta_y)
-            elif self.active_handle == 'nw':
-                # Top-left corner
-                new_left = min(old_rect.left() + delta_x, old_rect.right() - MIN_ZONE_SIZE * (self.image_size / self.world_size))
-                new_top = min(old_rect.top() + delta_y, old_rect.bottom() - MIN_ZONE_SIZE * (self.image_size / self.world_size))
-                new_rect.setTopLeft(QPointF(new_left, new_top))
-            elif self.active_handle == 'ne':
-                # Top-right corner
-                new_right = max(old_rect.right() + delta_x, old_rect.left() + MIN_ZONE_SIZE * (self.image_size / self.world_size))
-                new_top = min(old_rect.top() + delta_y, old_rect.bottom() - MIN_ZONE_SIZE * (self.image_size / self.world_size))
-                new_rect.setTopRight(QPointF(new_right, new_top))
-            elif self.active_handle == 'sw':
-                # Bottom-left corner
-                new_left = min(old_rect.left() + delta_x, old_rect.right() - MIN_ZONE_SIZE * (self.image_size / self.world_size))
-                new_bottom = max(old_rect.bottom() + delta_y, old_rect.top() + MIN_ZONE_SIZE * (self.image_size / self.world_size))
-                new_rect.setBottomLeft(QPointF(new_left, new_bottom))
-            elif self.active_handle == 'se':
-                # Bottom-right corner
-                new_right = max(old_rect.right() + delta_x, old_rect.left() + MIN_ZONE_SIZE * (self.image_size / self.world_size))
-                new_bottom = max(old_rect.bottom() + delta_y, old_rect.top() + MIN_ZONE_SIZE * (self.image_size / self.world_size))
-                new_rect.setBottomRight(QPointF(new_right, new_bottom))
+                new_rect = self.drag_start_rect.translated(delta_x, delta_y)
+            else:
+                if self.active_handle == 'nw':
+                    # Top-left corner
+                    left = min(left + delta_x, max_left)
+                    top = min(top + delta_y, max_top)
+                elif self.active_handle == 'ne':
+                    # Top-right corner
+                    right = max(right + delta_x, min_right)
+                    top = min(top + delta_y, max_top)
+                elif self.active_handle == 'sw':
+                    # Bottom-left corner
+                    left = min(left + delta_x, max_left)
+                    bottom = max(bottom + delta_y, min_bottom)
+                elif self.active_handle == 'se':
+                    # Bottom-right corner
+                    right = max(right + delta_x, min_right)
+                    bottom = max(bottom + delta_y, min_bottom)
+                new_rect = QRectF(left, top, right - left, bottom - top)
+            
+            # Cursor paused or clamped: nothing moved since the last event
+            if new_rect == self.drag_last_rect:
+                return
+            self.drag_last_rect = new_rect
             
             # Update zone rectangle
             zone_item.setRect(new_rect)
@@ -917,9 +1046,8 @@ class MapCanvas(QGraphicsView):
             self._update_resize_handles(new_rect)
             
             # Update label position if exists
-            if self.selected_zone_id and self.selected_zone_id in self.zone_labels:
-                label = self.zone_labels[self.selected_zone_id]
-                label.setPos(new_rect.x() + 5, new_rect.y() + 5)
+            if self.drag_label:
+                self.drag_label.setPos(new_rect.x() + 5, new_rect.y() + 5)
             
             return
         
@@ -973,6 +1101,8 @@ class MapCanvas(QGraphicsView):
             self.active_handle = None
             self.drag_start_pos = None
             self.drag_start_rect = None
+            self.drag_item = None
+            self.drag_label = None
             self.setDragMode(QGraphicsView.NoDrag)
             return
         
@@ -1001,6 +1131,8 @@ class MapCanvas(QGraphicsView):
             self.active_handle = None
             self.drag_start_pos = None
             self.drag_start_rect = None
+            self.drag_item = None
+            self.drag_label = None
             self.setDragMode(QGraphicsView.NoDrag)
             return
         
@@ -1011,49 +1143,19 @@ class MapCanvas(QGraphicsView):
         if len(self.resize_handles) != 4:
             return
         
+        # Compute all handle edges first, then write each handle once
         handle_size = self.resize_handle_size
-        positions = [
-            rect.topLeft(),
-            rect.topRight(),
-            rect.bottomLeft(),
-            rect.bottomRight(),
-        ]
-        
-        for i, pos in enumerate(positions):
-            if i < len(self.resize_handles):
-                handle = self.resize_handles[i]
-                handle.setRect(
-                    pos.x() - handle_size/2,
-                    pos.y() - handle_size/2,
-                    handle_size,
-                    handle_size
-                )
-    
-    def _create_resize_handles_for_item(self, rect_item):
-        """Create resize handles for any rectangle item"""
-        rect = rect_item.rect()
-        handle_size = self.resize_handle_size
-        
-        positions = [
-            ('nw', rect.topLeft()),
-            ('ne', rect.topRight()),
-            ('sw', rect.bottomLeft()),
-            ('se', rect.bottomRight()),
-        ]
-        
-        for handle_type, pos in positions:
-            handle = self.scene.addRect(
-                pos.x() - handle_size/2,
-                pos.y() - handle_size/2,
-                handle_size,
-                handle_size
-            )
-            handle.setBrush(QBrush(QColor(0, 120, 255)))
-            handle.setPen(QPen(QColor(255, 255, 255), 1))
-            handle.setZValue(999999)
-            handle.setData(0, f"handle_{handle_type}")
-            handle.setData(1, "temp_new_zone")
-            self.resize_handles.append(handle)
+        left = rect.left() - handle_size/2
+        top = rect.top() - handle_size/2
+        right = rect.right() - handle_size/2
+        bottom = rect.bottom() - handle_size/2
+        
+        # Handles are created in nw, ne, sw, se order
+        nw, ne, sw, se = self.resize_handles
+        nw.setRect(left, top, handle_size, handle_size)
+        ne.setRect(right, top, handle_size, handle_size)
+        sw.setRect(left, bottom, handle_size, handle_size)
+        se.setRect(right, bottom, handle_size, handle_size)
     
     def finalize_new_zone(self):
         """Finalize the new zone and show dialog"""
@@ -1146,6 +1248,38 @@ class MapCanvas(QGraphicsView):
         self._apply_zoom(factor)
 
 
+def build_config_tooltips(config_mapping: Dict, category_definitions: Dict) -> Dict[int, str]:
+    """Build config dropdown tooltips (categories and first zombies of each config)
+    
+    Categories are shared by many configs, so each category's preview is
+    rendered once and reused.
+    """
+    category_previews = {}
+    tooltips = {}
+    
+    for config_num in sorted(config_mapping.keys()):
+        tooltip_parts = [f"Config {config_num}:"]
+        
+        for cat_name in config_mapping[config_num].values():
+            if cat_name and cat_name in category_definitions:
+                preview = category_previews.get(cat_name)
+                if preview is None:
+                    zombies = category_definitions[cat_name]
+                    preview_parts = [f"\n{cat_name} ({len(zombies)} zombies):"]
+                    # Show first 10 zombies
+                    for zombie in zombies[:10]:
+                        preview_parts.append(f"  • {zombie}")
+                    if len(zombies) > 10:
+                        preview_parts.append(f"  ... and {len(zombies) - 10} more")
+                    preview = "\n".join(preview_parts)
+                    category_previews[cat_name] = preview
+                tooltip_parts.append(preview)
+        
+        tooltips[config_num] = "\n".join(tooltip_parts)
+    
+    return tooltips
+
+
 class NewZoneDialog(QDialog):
     """Dialog for creating a new zone"""
     
@@ -1195,21 +1329,10 @@ class NewZoneDialog(QDialog):
         
         # Populate with configs and tooltips
         if hasattr(main_window, 'config_mapping') and hasattr(main_window, 'category_definitions'):
+            # Reuse the tooltips the properties panel built for the same mapping
+            tooltips = main_window.properties_panel.config_tooltips
             for config_num in sorted(main_window.config_mapping.keys()):
-                # Build tooltip
-                tooltip_parts = [f"Config {config_num}:"]
-                mapping = main_window.config_mapping[config_num]
-                
-                for cat_key, cat_name in mapping.items():
-                    if cat_name and cat_name in main_window.category_definitions:
-                        zombies = main_window.category_definitions[cat_name]
-                        tooltip_parts.append(f"\n{cat_name} ({len(zombies)} zombies):")
-                        for zombie in zombies[:10]:
-                            tooltip_parts.append(f"  • {zombie}")
-                        if len(zombies) > 10:
-                            tooltip_parts.append(f"  ... and {len(zombies) - 10} more")
-                
-                tooltip_text = "\n".join(tooltip_parts)
+                tooltip_text = tooltips.get(config_num, f"Config {config_num}:")
                 
                 self.config_combo.addItem(f"{config_num}", config_num)
                 self.config_combo.setItemData(
@@ -1276,6 +1399,7 @@ class PropertiesPanel(QWidget):
         self.current_zone = None
         self.config_mapping = {}
         self.category_definitions = {}
+        self.config_tooltips = {}  # config_num -> tooltip text
         
         self._setup_ui()
     
@@ -1314,6 +1438,7 @@ class PropertiesPanel(QWidget):
         self.categories_text.setReadOnly(True)
         self.categories_text.setMaximumHeight(200)
         self.categories_text.setOpenExternalLinks(False)  # Handle clicks internally
+        self.categories_text.anchorClicked.connect(self._show_all_zombies)
         layout.addWidget(QLabel("Categories & Zombies:"))
         layout.addWidget(self.categories_text)
         
@@ -1339,31 +1464,22 @@ class PropertiesPanel(QWidget):
         self.config_mapping = config_mapping
         self.category_definitions = category_definitions
         
-        # Update combo
-        self.config_combo.clear()
-        for config_num in sorted(config_mapping.keys()):
-            # Build tooltip text with categories and zombies
-            tooltip_parts = [f"Config {config_num}:"]
-            mapping = config_mapping[config_num]
-            
-            for cat_key, cat_name in mapping.items():
-                if cat_name and cat_name in category_definitions:
-                    zombies = category_definitions[cat_name]
-                    tooltip_parts.append(f"\n{cat_name} ({len(zombies)} zombies):")
-                    # Show first 10 zombies
-                    for zombie in zombies[:10]:
-                        tooltip_parts.append(f"  • {zombie}")
-                    if len(zombies) > 10:
-                        tooltip_parts.append(f"  ... and {len(zombies) - 10} more")
-            
-            tooltip_text = "\n".join(tooltip_parts)
-            
-            self.config_combo.addItem(f"{config_num}", config_num)
-            self.config_combo.setItemData(
-                self.config_combo.count() - 1, 
-                tooltip_text, 
-                Qt.ToolTipRole
-            )
+        # Build tooltip text with categories and zombies
+        self.config_tooltips = build_config_tooltips(config_mapping, category_definitions)
+        
+        # Update combo. Signals stay blocked while it is rebuilt: otherwise the
+        # clear and the first insert each fire _on_config_changed, which
+        # reassigns the shown zone's categories to whichever config is first
+        self.config_combo.blockSignals(True)
+        try:
+            self.config_combo.clear()
+            for index, config_num in enumerate(sorted(config_mapping.keys())):
+                tooltip_text = self.config_tooltips[config_num]
+                
+                self.config_combo.addItem(f"{config_num}", config_num)
+                self.config_combo.setItemData(index, tooltip_text, Qt.ToolTipRole)
+        finally:
+            self.config_combo.blockSignals(False)
     
     def set_zone(self, zone: ZoneData):
         """Set current zone for editing"""
@@ -1419,14 +1535,14 @@ class PropertiesPanel(QWidget):
             return
         
         config_num = self.config_combo.currentData()
-        if config_num is not None and config_num in self.config_mapping:
-            # Update zone categories
-            mapping = self.config_mapping[config_num]
-            self.current_zone.categories = {}
-            
-            for cat_key, cat_name in mapping.items():
-                if cat_name and cat_name in self.category_definitions:
-                    self.current_zone.categories[cat_name] = self.category_definitions[cat_name]
+        mapping = self.config_mapping.get(config_num)
+        if mapping is not None:
+            # Update zone categories (a new dict - zones may share the old one)
+            self.current_zone.categories = {
+                cat_name: self.category_definitions[cat_name]
+                for cat_name in mapping.values()
+                if cat_name and cat_name in self.category_definitions
+            }
             
             self._update_categories_display()
     
@@ -1446,7 +1562,6 @@ class PropertiesPanel(QWidget):
                 return
             
             text_parts = []
-            all_zombies = []
             
             for cat_name, zombies in self.current_zone.categories.items():
                 logger.debug(f"Processing category: {cat_name} with {len(zombies)} zombies")
@@ -1456,7 +1571,6 @@ class PropertiesPanel(QWidget):
                 if len(zombies) > 5:
                     text_parts.append(f"  <i>... and {len(zombies) - 5} more</i>")
                 text_parts.append("")
-                all_zombies.extend(zombies)
             
             # Add View All button if we truncated
             if any(len(zombies) > 5 for zombies in self.current_zone.categories.values()):
@@ -1464,13 +1578,6 @@ class PropertiesPanel(QWidget):
             
             self.categories_text.setHtml("<br>".join(text_parts))
             
-            # Connect link click (disconnect first to avoid multiple connections)
-            try:
-                self.categories_text.anchorClicked.disconnect()
-            except:
-                pass
-            self.categories_text.anchorClicked.connect(self._show_all_zombies)
-            
             logger.debug("Categories display updated successfully")
             
         except Exception as e:
@@ -1483,8 +1590,15 @@ class PropertiesPanel(QWidget):
         if not self.current_zone:
             return
         
-        self.current_zone.num_config = self.config_combo.currentData()
-        self.current_zone.comment = self.comment_input.text().strip()
+        num_config = self.config_combo.currentData()
+        comment = self.comment_input.text().strip()
+        
+        # Nothing edited: skip the canvas/tree rebuild and the unsaved-changes mark
+        if num_config == self.current_zone.num_config and comment == self.current_zone.comment:
+            return
+        
+        self.current_zone.num_config = num_config
+        self.current_zone.comment = comment
         
         self.zone_updated.emit(self.current_zone)
     
@@ -1537,6 +1651,8 @@ class MainWindow(QMainWindow):
         
         # Data
         self.all_zones = []  # All zones including config=0
+        self.zones_by_id = {}  # zone_id -> ZoneData for all_zones
+        self.zone_tree_items = {}  # zone_id -> QTreeWidgetItem in zone_tree
         self.zones = []  # Only zones with config > 0 (displayed)
         self.config_mapping = {}
         self.category_definitions = {}
@@ -1602,28 +1718,36 @@ class MainWindow(QMainWindow):
                 },
                 'last_updated': datetime.now().isoformat()
             }
-            with open(SETTINGS_FILE, 'w') as f:
-                json.dump(settings, f, indent=2)
+            # Write to a temp file and swap it in so a crash mid-write
+            # never leaves a truncated settings file behind
+            tmp_file = SETTINGS_FILE + '.tmp'
+            Path(tmp_file).write_text(json.dumps(settings, indent=2), encoding='utf-8')
+            os.replace(tmp_file, SETTINGS_FILE)
             logger.info("Settings saved")
-        except Exception as e:
+        except OSError as e:
             logger.error(f"Failed to save settings: {e}")
     
     def _load_settings(self):
         """Load previous file paths and map config from settings file"""
         try:
-            if os.path.exists(SETTINGS_FILE):
-                with open(SETTINGS_FILE, 'r') as f:
-                    settings = json.load(f)
-                    self.current_file_paths = settings.get('file_paths', self.current_file_paths)
-                    
-                    # Load map configuration
-                    map_config = settings.get('map_config', {})
-                    self.map_preset = map_config.get('preset', 'Deer Isle')
-                    self.world_size = map_config.get('world_size', 16384)
-                    self.image_size = map_config.get('image_size', 4096)
-                    
-                    logger.info(f"Settings loaded: map={self.map_preset}, world_size={self.world_size}")
-        except Exception as e:
+            settings = json.loads(Path(SETTINGS_FILE).read_bytes())
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as e:  # unreadable file or invalid JSON
+            logger.error(f"Failed to load settings: {e}")
+            return
+        
+        try:
+            self.current_file_paths = settings.get('file_paths', self.current_file_paths)
+            
+            # Load map configuration
+            map_config = settings.get('map_config', {})
+            self.map_preset = map_config.get('preset', 'Deer Isle')
+            self.world_size = map_config.get('world_size', 16384)
+            self.image_size = map_config.get('image_size', 4096)
+            
+            logger.info(f"Settings loaded: map={self.map_preset}, world_size={self.world_size}")
+        except (AttributeError, TypeError, ValueError) as e:  # valid JSON, wrong shape
             logger.error(f"Failed to load settings: {e}")
     
     def _setup_ui(self):
@@ -1966,10 +2090,11 @@ class MainWindow(QMainWindow):
             logger.info("Starting file loading...")
             
             # Check required files
-            missing = []
-            for key, info in self.file_inputs.items():
-                if info['required'] and not info['widget'].text():
-                    missing.append(key)
+            selected_paths = {key: info['widget'].text() for key, info in self.file_inputs.items()}
+            missing = [
+                key for key, info in self.file_inputs.items()
+                if info['required'] and not selected_paths[key]
+            ]
             
             if missing:
                 QMessageBox.warning(
@@ -1978,6 +2103,29 @@ class MainWindow(QMainWindow):
                 )
                 return
             
+            # One stat per selected file, so every bad path is reported together.
+            # Run concurrently - on network shares each stat is a round trip
+            to_check = [key for key, path in selected_paths.items() if path]
+            with ThreadPoolExecutor(max_workers=len(to_check)) as executor:
+                found = list(executor.map(os.path.isfile, (selected_paths[key] for key in to_check)))
+            not_found = []
+            for key, ok in zip(to_check, found):
+                if ok:
+                    continue
+                if self.file_inputs[key]['required']:
+                    not_found.append(selected_paths[key])
+                else:
+                    # Optional inputs are skipped, the load goes on without them
+                    logger.warning(f"Optional file not found, skipping: {selected_paths[key]}")
+                    selected_paths[key] = ''
+            
+            if not_found:
+                QMessageBox.warning(
+                    self, "Files Not Found",
+                    "These files do not exist:\n" + '\n'.join(not_found)
+                )
+                return
+            
             # Get and validate map configuration
             try:
                 self.map_preset = self.map_preset_combo.currentText()
@@ -1998,83 +2146,100 @@ class MainWindow(QMainWindow):
                 )
                 return
             
+            # Read all input files concurrently - they don't depend on each other
+            parsers = {
+                'dynamic': FileParser.parse_dynamic_zones,
+                'static': FileParser.parse_static_zones,
+                'categories_mapping': FileParser.parse_categories_mapping,
+                'categories_definitions': FileParser.parse_categories_definitions,
+                'zombie_health': FileParser.parse_zombie_health,
+                # Decoding a large PNG is the slowest step; QImage is safe off the GUI thread
+                'map_image': QImage,
+            }
+            with ThreadPoolExecutor(max_workers=len(parsers)) as executor:
+                parse_results = {
+                    key: executor.submit(parser, selected_paths[key])
+                    for key, parser in parsers.items()
+                    if selected_paths[key]
+                }
+            
             # Dynamic zones
-            dynamic_path = self.file_inputs['dynamic']['widget'].text()
+            dynamic_path = selected_paths['dynamic']
             if dynamic_path:
                 logger.info(f"Loading dynamic zones from: {dynamic_path}")
-                dynamic_zones = FileParser.parse_dynamic_zones(dynamic_path)
+                dynamic_zones = parse_results['dynamic'].result()
                 logger.info(f"Parsed {len(dynamic_zones)} dynamic zones")
                 self.current_file_paths['dynamic'] = dynamic_path
             else:
                 dynamic_zones = []
             
             # Static zones
-            static_path = self.file_inputs['static']['widget'].text()
+            static_path = selected_paths['static']
             if static_path:
                 logger.info(f"Loading static zones from: {static_path}")
-                static_zones = FileParser.parse_static_zones(static_path)
+                static_zones = parse_results['static'].result()
                 logger.info(f"Parsed {len(static_zones)} static zones")
                 self.current_file_paths['static'] = static_path
             else:
                 static_zones = []
             
             # Categories mapping
-            mapping_path = self.file_inputs['categories_mapping']['widget'].text()
+            mapping_path = selected_paths['categories_mapping']
             if mapping_path:
                 logger.info(f"Loading category mappings from: {mapping_path}")
-                self.config_mapping = FileParser.parse_categories_mapping(mapping_path)
+                self.config_mapping = parse_results['categories_mapping'].result()
                 logger.info(f"Parsed {len(self.config_mapping)} config mappings")
                 self.current_file_paths['categories_mapping'] = mapping_path
             
             # Categories definitions
-            definitions_path = self.file_inputs['categories_definitions']['widget'].text()
+            definitions_path = selected_paths['categories_definitions']
             if definitions_path:
                 logger.info(f"Loading category definitions from: {definitions_path}")
-                self.category_definitions = FileParser.parse_categories_definitions(definitions_path)
+                self.category_definitions = parse_results['categories_definitions'].result()
                 logger.info(f"Parsed {len(self.category_definitions)} category definitions")
                 self.current_file_paths['categories_definitions'] = definitions_path
             
             # Map image
-            map_path = self.file_inputs['map_image']['widget'].text()
+            map_path = selected_paths['map_image']
             if map_path:
                 logger.info(f"Loading map image from: {map_path}")
                 
-                # Load image and auto-detect size
-                try:
-                    with Image.open(map_path) as img:
-                        # Validate square image
-                        if img.width != img.height:
-                            QMessageBox.critical(
-                                self, "Invalid Map Image",
-                                f"Map image must be square!\n\n"
-                                f"Current size: {img.width}x{img.height}\n\n"
-                                f"Please use a square image (e.g., 2048x2048, 4096x4096)"
-                            )
-                            logger.error(f"Non-square image rejected: {img.width}x{img.height}")
-                            return
-                        
-                        self.image_size = img.width
-                        logger.info(f"Image size auto-detected: {img.width}x{img.height}")
-                except Exception as e:
-                    logger.error(f"Failed to detect image size: {e}")
+                # Auto-detect size from the image decoded in the pool
+                img = parse_results['map_image'].result()
+                if img.isNull():
+                    logger.error(f"Failed to decode map image: {map_path}")
                     QMessageBox.critical(
                         self, "Error",
-                        f"Failed to load map image:\n{e}"
+                        f"Failed to load map image:\n{map_path}"
                     )
                     return
                 
+                # Validate square image
+                if img.width() != img.height():
+                    QMessageBox.critical(
+                        self, "Invalid Map Image",
+                        f"Map image must be square!\n\n"
+                        f"Current size: {img.width()}x{img.height()}\n\n"
+                        f"Please use a square image (e.g., 2048x2048, 4096x4096)"
+                    )
+                    logger.error(f"Non-square image rejected: {img.width()}x{img.height()}")
+                    return
+                
+                self.image_size = img.width()
+                logger.info(f"Image size auto-detected: {img.width()}x{img.height()}")
+                
                 # Load map and configure canvas
-                self.canvas.load_map_image(map_path)
+                self.canvas.load_map_image(map_path, img)
                 self.canvas.set_map_config(self.world_size, self.image_size)
                 self.current_file_paths['map_image'] = map_path
                 
                 logger.info(f"Map configured: world={self.world_size}, image={self.image_size}")
             
             # Zombie health (optional)
-            health_path = self.file_inputs['zombie_health']['widget'].text()
+            health_path = selected_paths['zombie_health']
             if health_path:
                 logger.info(f"Loading zombie health from: {health_path}")
-                self.zombie_health = FileParser.parse_zombie_health(health_path)
+                self.zombie_health = parse_results['zombie_health'].result()
                 logger.info(f"Parsed health for {len(self.zombie_health)} zombie types")
                 self.current_file_paths['zombie_health'] = health_path
             else:
@@ -2085,49 +2250,68 @@ class MainWindow(QMainWindow):
             logger.info("Processing zones...")
             self.all_zones = dynamic_zones + static_zones
             self.zones = [z for z in self.all_zones if z.num_config > 0]
+            
+            # Index for zone lookups by ID; the first zone wins on duplicate IDs
+            self.zones_by_id = {}
+            for zone in self.all_zones:
+                self.zones_by_id.setdefault(zone.zone_id, zone)
             logger.info(f"Total zones: {len(self.all_zones)}, Active zones: {len(self.zones)}")
             
             # Populate categories for zones
             logger.info("Populating categories for zones...")
+            # Resolve each config's categories once; zones sharing a config share the
+            # dict, so code scanning zone categories can key on id(zone.categories)
+            # (zone.categories is always reassigned, never mutated in place)
+            config_categories = {}
             for zone in self.zones:
-                if zone.num_config in self.config_mapping:
-                    mapping = self.config_mapping[zone.num_config]
-                    zone.categories = {}
-                    for cat_key, cat_name in mapping.items():
-                        if cat_name and cat_name in self.category_definitions:
-                            zone.categories[cat_name] = self.category_definitions[cat_name]
+                categories = config_categories.get(zone.num_config)
+                if categories is None:
+                    mapping = self.config_mapping.get(zone.num_config)
+                    if mapping is None:
+                        continue
+                    categories = {
+                        cat_name: self.category_definitions[cat_name]
+                        for cat_name in mapping.values()
+                        if cat_name and cat_name in self.category_definitions
+                    }
+                    config_categories[zone.num_config] = categories
+                zone.categories = categories
             
             logger.info("Updating UI...")
-            # Update UI
-            self.canvas.set_zones(self.zones)
-            self._update_zone_tree()
-            self.properties_panel.set_config_mapping(self.config_mapping, self.category_definitions)
+            # Drop the old zones first so new health data doesn't recolor them
+            self.canvas.clear_zones()
             
-            # Pass zombie health data to canvas for danger color coding
+            # Pass zombie health data to canvas before adding zones, so each zone's
+            # danger color is computed once as it is created
             if self.zombie_health:
                 logger.info("Setting zombie health data for danger color coding")
                 self.canvas.set_zombie_health(self.zombie_health)
                 
                 # Show health range info to user
-                if hasattr(self.canvas, 'min_health') and hasattr(self.canvas, 'max_health'):
-                    health_info = (
-                        f"Danger color coding enabled!\n\n"
-                        f"Health range: {self.canvas.min_health:.1f} - {self.canvas.max_health:.1f}\n\n"
-                        f"Color thresholds (relative to your zombies):\n"
-                        f"🟢 Green: ≤ {self.canvas.health_20th:.1f} (weakest 20%)\n"
-                        f"🟡 Yellow-Green: ≤ {self.canvas.health_40th:.1f}\n"
-                        f"🟡 Yellow: ≤ {self.canvas.health_60th:.1f} (average)\n"
-                        f"🟠 Orange: ≤ {self.canvas.health_80th:.1f}\n"
-                        f"🔴 Red: > {self.canvas.health_80th:.1f} (strongest 20%)"
-                    )
-                    logger.info(health_info.replace('\n', ' / '))
+                health_info = (
+                    f"Danger color coding enabled!\n\n"
+                    f"Health range: {self.canvas.min_health:.1f} - {self.canvas.max_health:.1f}\n\n"
+                    f"Color thresholds (relative to your zombies):\n"
+                    f"🟢 Green: ≤ {self.canvas.health_20th:.1f} (weakest 20%)\n"
+                    f"🟡 Yellow-Green: ≤ {self.canvas.health_40th:.1f}\n"
+                    f"🟡 Yellow: ≤ {self.canvas.health_60th:.1f} (average)\n"
+                    f"🟠 Orange: ≤ {self.canvas.health_80th:.1f}\n"
+                    f"🔴 Red: > {self.canvas.health_80th:.1f} (strongest 20%)"
+                )
+                logger.info(health_info.replace('\n', ' / '))
+            
+            # Update UI
+            self.canvas.set_zones(self.zones)
+            self._update_zone_tree()
+            self.properties_panel.set_config_mapping(self.config_mapping, self.category_definitions)
             
             # Populate filter options based on loaded data
             self._populate_filter_options()
             
             # Count active and available zones
-            dynamic_active = len([z for z in dynamic_zones if z.num_config > 0])
-            dynamic_available = len([z for z in dynamic_zones if z.num_config == 0])
+            # num_config is never negative for dynamic zones
+            dynamic_active = sum(1 for z in dynamic_zones if z.num_config > 0)
+            dynamic_available = len(dynamic_zones) - dynamic_active
             
             logger.info("File loading complete!")
             
@@ -2139,7 +2323,7 @@ class MainWindow(QMainWindow):
                 f"{len(static_zones)} static zones"
             )
             
-            if self.zombie_health and hasattr(self.canvas, 'min_health'):
+            if self.zombie_health:
                 success_msg += (
                     f"\n\n✓ Danger color coding: {self.canvas.min_health:.0f}-{self.canvas.max_health:.0f} HP"
                 )
@@ -2167,8 +2351,9 @@ class MainWindow(QMainWindow):
             dynamic_zones = [z for z in self.all_zones if z.zone_type == 'dynamic']
             FileParser.save_dynamic_zones(dynamic_zones, self.current_file_paths['dynamic'])
             
-            dynamic_active = len([z for z in dynamic_zones if z.num_config > 0])
-            dynamic_available = len([z for z in dynamic_zones if z.num_config == 0])
+            # num_config is never negative for dynamic zones
+            dynamic_active = sum(1 for z in dynamic_zones if z.num_config > 0)
+            dynamic_available = len(dynamic_zones) - dynamic_active
             
             # Save static zones if loaded
             static_saved = False
@@ -2176,18 +2361,20 @@ class MainWindow(QMainWindow):
             if self.current_file_paths['static']:
                 static_zones = [z for z in self.all_zones if z.zone_type == 'static']
                 FileParser.save_static_zones(static_zones, self.current_file_paths['static'])
-                static_count = len([z for z in static_zones if z.num_config > 0])
+                static_count = sum(1 for z in static_zones if z.num_config > 0)
                 static_saved = True
             
             # Clear unsaved changes flag
             self.has_unsaved_changes = False
             self._update_title()
             
-            message = f"Files saved successfully!\n\n"
-            message += f"Dynamic zones: {dynamic_active} active, {dynamic_available} available\n"
-            if static_saved:
-                message += f"Static zones: {static_count} saved\n"
-            message += f"\nBackup created with .backup extension"
+            static_line = f"Static zones: {static_count} saved\n" if static_saved else ""
+            message = (
+                f"Files saved successfully!\n\n"
+                f"Dynamic zones: {dynamic_active} active, {dynamic_available} available\n"
+                f"{static_line}"
+                f"\nBackup created with .backup extension"
+            )
             
             QMessageBox.information(self, "Success", message)
         
@@ -2198,6 +2385,8 @@ class MainWindow(QMainWindow):
         """Update zone tree"""
         self.zone_tree.clear()
         
+        items = []
+        self.zone_tree_items = {}
         for zone in self.zones:
             item = QTreeWidgetItem([
                 zone.zone_id,
@@ -2205,7 +2394,11 @@ class MainWindow(QMainWindow):
                 zone.zone_type.capitalize()
             ])
             item.setData(0, Qt.UserRole, zone.zone_id)
-            self.zone_tree.addTopLevelItem(item)
+            items.append(item)
+            self.zone_tree_items.setdefault(zone.zone_id, item)
+        
+        # One insert instead of a model update and relayout per zone
+        self.zone_tree.addTopLevelItems(items)
     
     def _on_zone_selected(self, item, column):
         """Handle zone selection from tree"""
@@ -2248,11 +2441,9 @@ class MainWindow(QMainWindow):
                 self.properties_panel.set_zone(zone)
                 
                 # Select in tree AND highlight in canvas
-                for i in range(self.zone_tree.topLevelItemCount()):
-                    item = self.zone_tree.topLevelItem(i)
-                    if item.data(0, Qt.UserRole) == zone_id:
-                        self.zone_tree.setCurrentItem(item)
-                        break
+                item = self.zone_tree_items.get(zone_id)
+                if item:
+                    self.zone_tree.setCurrentItem(item)
                 
                 # Make sure canvas highlights the zone
                 self.canvas.select_zone(zone_id)
@@ -2306,10 +2497,7 @@ class MainWindow(QMainWindow):
     
     def _find_zone(self, zone_id: str) -> Optional[ZoneData]:
         """Find zone by ID"""
-        for zone in self.all_zones:
-            if zone.zone_id == zone_id:
-                return zone
-        return None
+        return self.zones_by_id.get(zone_id)
     
     def _update_title(self):
         """Update window title to show unsaved changes"""
@@ -2380,11 +2568,11 @@ class MainWindow(QMainWindow):
     
     def _enable_draw_mode(self):
         """Enable drawing mode"""
-        # Check for available zones (config=0)
-        available_zones = [z for z in self.all_zones 
-                          if z.zone_type == 'dynamic' and z.num_config == 0]
+        # Check for available zones (config=0); only the count is needed here
+        available_count = sum(1 for z in self.all_zones
+                              if z.zone_type == 'dynamic' and z.num_config == 0)
         
-        if not available_zones:
+        if not available_count:
             QMessageBox.warning(
                 self, "No Available Zones",
                 "All Zone001-Zone150 slots are assigned.\n\n"
@@ -2404,7 +2592,7 @@ class MainWindow(QMainWindow):
                 f"Click and drag on the map to draw a new zone rectangle.\n\n"
                 f"You can resize the zone by dragging corners after drawing.\n"
                 f"Click 'Done Adding' when you're happy with the size/position.\n\n"
-                f"{len(available_zones)} zone slots available."
+                f"{available_count} zone slots available."
             )
         else:
             # User clicked "Done Adding" - finish the zone
@@ -2518,23 +2706,14 @@ class MainWindow(QMainWindow):
         
         elif filter_type == "category":
             # Populate with all unique categories across all zones
-            categories = set()
-            for zone in self.zones:
-                if hasattr(zone, 'categories') and zone.categories:
-                    for cat_name in zone.categories.keys():
-                        categories.add(cat_name)
+            categories = self._used_categories()
             
             for cat_name in sorted(categories):
                 self.filter_value_combo.addItem(cat_name, ("category", cat_name))
         
         elif filter_type == "zombie":
             # Populate with all unique zombie classes across all zones
-            zombies = set()
-            for zone in self.zones:
-                if hasattr(zone, 'categories') and zone.categories:
-                    for zombie_list in zone.categories.values():
-                        for zombie in zombie_list:
-                            zombies.add(zombie)
+            zombies = self._used_zombies()
             
             for zombie in sorted(zombies):
                 self.filter_value_combo.addItem(zombie, ("zombie", zombie))
@@ -2569,6 +2748,9 @@ class MainWindow(QMainWindow):
         
         filter_value_type, filter_value = filter_data
         
+        # Keyed by id(zone.categories)
+        zombie_matches = {}
+        
         # Apply appropriate filter
         for zone in self.zones:
             if zone.zone_id not in self.canvas.zone_graphics:
@@ -2582,20 +2764,41 @@ class MainWindow(QMainWindow):
             
             elif filter_value_type == "category":
                 # Filter by category - show if zone has this category
-                if hasattr(zone, 'categories') and zone.categories:
+                if zone.categories:
                     visible = filter_value in zone.categories
             
             elif filter_value_type == "zombie":
                 # Filter by zombie class - show if zone has this zombie in any category
-                if hasattr(zone, 'categories') and zone.categories:
-                    for zombie_list in zone.categories.values():
-                        if filter_value in zombie_list:
-                            visible = True
-                            break
+                if zone.categories:
+                    key = id(zone.categories)
+                    visible = zombie_matches.get(key)
+                    if visible is None:
+                        visible = zombie_matches[key] = any(
+                            filter_value in zombie_list for zombie_list in zone.categories.values()
+                        )
             
             self.canvas.zone_graphics[zone.zone_id].setVisible(visible)
             self.canvas.zone_labels[zone.zone_id].setVisible(visible)
     
+    def _used_configs(self) -> set:
+        """Configs used by loaded zones"""
+        return {zone.num_config for zone in self.zones}
+    
+    def _unique_zone_categories(self) -> List[dict]:
+        """Categories dicts of loaded zones, each listed once"""
+        return list({id(zone.categories): zone.categories for zone in self.zones}.values())
+    
+    def _used_categories(self) -> set:
+        """Categories used by loaded zones"""
+        return set(chain.from_iterable(self._unique_zone_categories()))
+    
+    def _used_zombies(self) -> set:
+        """Zombie classes used by loaded zones"""
+        used_zombies = set()
+        for categories in self._unique_zone_categories():
+            used_zombies.update(chain.from_iterable(categories.values()))
+        return used_zombies
+    
     def _show_unused_configs(self):
         """Show list of unused configs"""
         if not self.config_mapping:
@@ -2603,13 +2806,10 @@ class MainWindow(QMainWindow):
             return
         
         # Get all configs that are in use
-        used_configs = set()
-        for zone in self.zones:
-            used_configs.add(zone.num_config)
+        used_configs = self._used_configs()
         
         # Get unused configs
-        all_configs = set(self.config_mapping.keys())
-        unused_configs = sorted(all_configs - used_configs)
+        unused_configs = sorted(self.config_mapping.keys() - used_configs)
         
         if not unused_configs:
             QMessageBox.information(
@@ -2654,14 +2854,10 @@ class MainWindow(QMainWindow):
             return
         
         # Get all categories that are in use by zones
-        used_categories = set()
-        for zone in self.zones:
-            if hasattr(zone, 'categories'):
-                used_categories.update(zone.categories.keys())
+        used_categories = self._used_categories()
         
         # Get unused categories
-        all_categories = set(self.category_definitions.keys())
-        unused_categories = sorted(all_categories - used_categories)
+        unused_categories = sorted(self.category_definitions.keys() - used_categories)
         
         if not unused_categories:
             QMessageBox.information(
@@ -2710,15 +2906,10 @@ class MainWindow(QMainWindow):
             return
         
         # Get all zombies that are in use by zones
-        used_zombies = set()
-        for zone in self.zones:
-            if hasattr(zone, 'categories'):
-                for zombie_list in zone.categories.values():
-                    used_zombies.update(zombie_list)
+        used_zombies = self._used_zombies()
         
         # Get unused zombies
-        all_zombies = set(self.zombie_health.keys())
-        unused_zombies = sorted(all_zombies - used_zombies)
+        unused_zombies = sorted(self.zombie_health.keys() - used_zombies)
         
         if not unused_zombies:
             QMessageBox.information(